@@ -1,5 +1,7 @@
 """Configuration management endpoints."""
 
+import asyncio
+
 from fastapi import APIRouter
 
 from backend.config import load_app_config, save_app_config
@@ -10,18 +12,27 @@ router = APIRouter(prefix="/api", tags=["config"])
 @router.get("/config")
 async def get_config():
     """Get the current application configuration."""
-    return load_app_config()
+    return await asyncio.to_thread(load_app_config)
 
 
-@router.put("/config")
-async def update_config(body: dict):
-    """Update the application configuration."""
+def _merge_and_save(body: dict) -> dict:
     current = load_app_config()
     current.update(body)
     save_app_config(current)
     return current
 
 
+@router.put("/config")
+async def update_config(body: dict):
+    """Update the application configuration.
+
+    The read-merge-write runs on a worker thread: config.json may live on
+    a slow or network-mounted home directory, and the write is never
+    served from the parse cache.
+    """
+    return await asyncio.to_thread(_merge_and_save, body)
+
+
 @router.get("/config/themes")
 async def list_themes():
     """List available themes."""
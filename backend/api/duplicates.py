@@ -7,7 +7,6 @@ from typing import List
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
-from send2trash import send2trash
 
 from backend.dependencies import get_db, get_thumbnail_cache
 from backend.services.media_service import MediaService
@@ -72,6 +71,8 @@ async def delete_duplicates(
     service: MediaService = Depends(_get_service),
 ):
     """Batch delete selected duplicate files."""
+    from send2trash import send2trash
+
     deleted = 0
     for fp in body.file_paths:
         try:
@@ -2,9 +2,12 @@
 
 import mimetypes
 from pathlib import Path
+from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from pydantic import BaseModel
 
 from backend.dependencies import get_db, get_thumbnail_cache
 from backend.services.media_service import MediaService
@@ -12,6 +15,21 @@ from backend.services.media_service import MediaService
 router = APIRouter(prefix="/api", tags=["media"])
 
 
+def _json_response(content: Any) -> Response:
+    """Serialize already-plain JSON content with orjson.
+
+    Returning a Response skips FastAPI's per-field ``jsonable_encoder``
+    walk, which dominates large list payloads.
+    """
+    return Response(orjson.dumps(content), media_type="application/json")
+
+
+# Range responses are read and yielded in chunks of this size. Each chunk
+# is a threadpool hop in StreamingResponse, so tiny chunks burn CPU on
+# high-bitrate (4K) video and starve the browser's decoder.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 def _get_service() -> MediaService:
     return MediaService(get_db(), get_thumbnail_cache())
 
@@ -31,9 +49,12 @@ async def list_media(
     (prompt, model, loras, tags, etc.) is only served by
     ``GET /api/media/{path}``.
     """
-    return await service.get_all_media_summaries(
+    summaries = await service.get_all_media_summaries(
         sort=sort, favorites_only=favorites_only
     )
+    # Summaries are plain JSON types already; tens of thousands of rows
+    # encode far faster through orjson than the default encoder path.
+    return _json_response(summaries)
 
 
 @router.get("/media/{file_path:path}")
@@ -52,7 +73,7 @@ async def get_media(
     if not media:
         raise HTTPException(status_code=404, detail="Media not found")
     tags = await service.get_tags_for_file(file_path)
-    return {**service.media_to_dict(media), "tags": tags}
+    return _json_response({**service.media_to_dict(media), "tags": tags})
 
 
 @router.delete("/media/{file_path:path}")
@@ -84,6 +105,27 @@ async def update_media(
     return service.media_to_summary_dict(media)
 
 
+class FavoriteRequest(BaseModel):
+    is_favorite: bool
+
+
+@router.put("/favorites/{file_path:path}")
+async def set_favorite(
+    file_path: str,
+    body: FavoriteRequest,
+    service: MediaService = Depends(_get_service),
+):
+    """Set one file's favorite flag.
+
+    The favorite toggle's fast path: a single-column UPDATE with no read
+    back of the media record, so the client can flip the star optimistically
+    and only needs to hear about failures.
+    """
+    if not await service.set_favorite(file_path, body.is_favorite):
+        raise HTTPException(status_code=404, detail="Media not found")
+    return {"file_path": file_path, "is_favorite": body.is_favorite}
+
+
 @router.get("/stream/{file_path:path}")
 async def stream_file(file_path: str, request: Request):
     """Serve a media file with HTTP Range support for streaming."""
@@ -108,7 +150,7 @@ async def stream_file(file_path: str, request: Request):
                 f.seek(start)
                 remaining = content_length
                 while remaining > 0:
-                    chunk_size = min(8192, remaining)
+                    chunk_size = min(STREAM_CHUNK_SIZE, remaining)
                     data = f.read(chunk_size)
                     if not data:
                         break
@@ -136,14 +178,31 @@ async def stream_file(file_path: str, request: Request):
 @router.get("/thumbnails/{file_path:path}")
 async def get_thumbnail(
     file_path: str,
+    request: Request,
     service: MediaService = Depends(_get_service),
 ):
-    """Serve a cached thumbnail, generating it if needed."""
+    """Serve a cached thumbnail, generating it if needed.
+
+    Once the browser's copy is past max-age it revalidates with
+    ``If-None-Match``; an unchanged thumbnail answers 304 instead of
+    resending the JPEG, so scrolling back over a large grid is cheap.
+    """
     thumbnail_path = await service.get_thumbnail_path(file_path)
-    if not thumbnail_path or not thumbnail_path.exists():
+    if not thumbnail_path:
+        raise HTTPException(status_code=404, detail="Thumbnail not available")
+    try:
+        stat = thumbnail_path.stat()
+    except OSError:
         raise HTTPException(status_code=404, detail="Thumbnail not available")
+    headers = {
+        "Cache-Control": "public, max-age=86400",
+        "ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
     return FileResponse(
         thumbnail_path,
         media_type="image/jpeg",
-        headers={"Cache-Control": "public, max-age=86400"},
+        headers=headers,
+        stat_result=stat,
     )
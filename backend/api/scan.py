@@ -4,13 +4,13 @@ import asyncio
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
 from backend.api import similarity as similarity_api
-from backend.config import load_app_config, get_directories
+from backend.config import DirectoryConfig, load_app_config, get_directories
 from backend.dependencies import get_db, get_thumbnail_cache
 from backend.ws.manager import ws_manager
 from metascan.core.scanner import Scanner
@@ -29,12 +29,15 @@ class ScanRequest(BaseModel):
     full_clean: bool = False  # destructive: truncates DB, preserves favorites
 
 
-@router.post("/prepare")
-async def prepare_scan():
-    """Count files in configured directories and return stats for confirmation."""
-    config = load_app_config()
-    directories = get_directories(config)
+def _count_media_files(
+    directories: List[DirectoryConfig],
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Count supported files per configured directory.
 
+    Runs on a worker thread — it walks every configured tree. Extensions
+    are compared as plain strings (``os.path.splitext``), so no ``Path``
+    is built per file.
+    """
     supported_extensions = {
         ".png",
         ".jpg",
@@ -46,6 +49,10 @@ async def prepare_scan():
         ".mov",
         ".bmp",
     }
+
+    def is_supported(name: str) -> bool:
+        return os.path.splitext(name)[1].lower() in supported_extensions
+
     total_files = 0
     dir_stats = []
 
@@ -56,15 +63,10 @@ async def prepare_scan():
         count = 0
         if d.search_subfolders:
             for root, _, files in os.walk(dir_path):
-                count += sum(
-                    1 for f in files if Path(f).suffix.lower() in supported_extensions
-                )
+                count += sum(1 for f in files if is_supported(f))
         else:
-            count = sum(
-                1
-                for f in dir_path.iterdir()
-                if f.is_file() and f.suffix.lower() in supported_extensions
-            )
+            with os.scandir(dir_path) as it:
+                count = sum(1 for e in it if is_supported(e.name) and e.is_file())
         total_files += count
         dir_stats.append(
             {
@@ -73,6 +75,15 @@ async def prepare_scan():
                 "search_subfolders": d.search_subfolders,
             }
         )
+    return total_files, dir_stats
+
+
+@router.post("/prepare")
+async def prepare_scan():
+    """Count files in configured directories and return stats for confirmation."""
+    config = load_app_config()
+    directories = get_directories(config)
+    total_files, dir_stats = await asyncio.to_thread(_count_media_files, directories)
 
     db = get_db()
     existing_count = len(await asyncio.to_thread(db.get_existing_file_paths))
@@ -391,7 +391,7 @@ async def update_similarity_settings(body: SimilaritySettingsUpdate):
             changed_model = True
         sim_config[field] = value
 
-    save_app_config(config)
+    await asyncio.to_thread(save_app_config, config)
 
     if changed_model and _inference_client is not None:
         model_key = sim_config.get("clip_model", "small")
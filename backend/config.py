@@ -1,5 +1,6 @@
 """Server configuration for the metascan backend."""
 
+import copy
 import json
 import os
 from dataclasses import dataclass, field
@@ -22,13 +23,29 @@ class ServerConfig:
     cors_origins: List[str] = field(default_factory=lambda: ["*"])
 
 
+# Parsed config.json keyed by (path, mtime_ns, size). Endpoints call
+# load_app_config() per request; re-reading and re-parsing the file is only
+# needed when it actually changed on disk.
+_config_cache: dict = {"key": None, "value": {}}
+
+
 def load_app_config() -> dict:
-    """Load the metascan config.json file."""
+    """Load the metascan config.json file.
+
+    Returns a fresh copy each call — callers routinely mutate the result
+    before handing it to :func:`save_app_config`.
+    """
     config_path = get_config_path()
-    if config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return {}
+    key = (str(config_path), st.st_mtime_ns, st.st_size)
+    if _config_cache["key"] != key:
         with open(config_path) as f:
-            return json.load(f)
-    return {}
+            _config_cache["value"] = json.load(f)
+        _config_cache["key"] = key
+    return copy.deepcopy(_config_cache["value"])
 
 
 def save_app_config(config: dict) -> None:
@@ -37,6 +54,7 @@ def save_app_config(config: dict) -> None:
     config_path.parent.mkdir(parents=True, exist_ok=True)
     with open(config_path, "w") as f:
         json.dump(config, f, indent=2)
+    _config_cache["key"] = None
 
 
 def get_server_config() -> ServerConfig:
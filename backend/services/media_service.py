@@ -5,8 +5,6 @@ import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
-from send2trash import send2trash
-
 from metascan.cache.thumbnail import ThumbnailCache
 from metascan.core.database_sqlite import DatabaseManager
 from metascan.core.media import Media
@@ -39,6 +37,10 @@ class MediaService:
 
     async def delete_media(self, file_path: str) -> bool:
         """Delete a media file by moving it to trash and removing from DB."""
+        # Deferred: send2trash pulls in its platform backend on import and is
+        # only needed on delete, not on every backend start.
+        from send2trash import send2trash
+
         path = Path(file_path)
         if path.exists():
             await asyncio.to_thread(send2trash, str(path))
@@ -70,9 +72,16 @@ class MediaService:
         return await asyncio.to_thread(self.db.get_favorite_media_paths)
 
     async def get_thumbnail_path(self, file_path: str) -> Optional[Path]:
-        return await asyncio.to_thread(
-            self.thumbnail_cache.get_or_create_thumbnail, Path(file_path)
+        path = Path(file_path)
+        cached = await asyncio.to_thread(
+            self.thumbnail_cache.get_cached_thumbnail, path
         )
+        if cached is not None:
+            return cached
+        # Misses decode on the cache's own bounded pool. A cold grid would
+        # otherwise park every default-executor thread in an image decode,
+        # and the DB calls that share that executor would queue behind them.
+        return await asyncio.wrap_future(self.thumbnail_cache.submit_thumbnail(path))
 
     async def get_stats(self) -> Dict[str, Any]:
         return await asyncio.to_thread(self.db.get_stats)
@@ -1,10 +1,10 @@
 """WebSocket connection manager with channel multiplexing."""
 
 import asyncio
-import json
 import logging
 from typing import Any, Callable, Coroutine, Dict, List, Optional
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
@@ -37,9 +37,16 @@ class ConnectionManager:
             f"WebSocket disconnected. Active connections: {len(self.active_connections)}"
         )
 
+    @staticmethod
+    def _encode(channel: str, event: str, data: Any) -> str:
+        envelope = {"channel": channel, "event": event, "data": data}
+        return orjson.dumps(envelope).decode()
+
     async def broadcast(self, channel: str, event: str, data: Any = None) -> None:
         """Broadcast a message to all connected clients."""
-        message = json.dumps({"channel": channel, "event": event, "data": data})
+        await self._send(self._encode(channel, event, data))
+
+    async def _send(self, message: str) -> None:
         disconnected = []
         for connection in self.active_connections:
             try:
@@ -54,11 +61,18 @@ class ConnectionManager:
 
         Uses the loop captured via attach_loop() so this works from threads
         without a running event loop (e.g. asyncio.to_thread workers).
+        The payload is serialized here, on the calling thread, so progress
+        streams from workers don't spend event-loop time encoding.
         """
         if self._loop is not None and not self._loop.is_closed():
-            asyncio.run_coroutine_threadsafe(
-                self.broadcast(channel, event, data), self._loop
-            )
+            # Callers are worker callbacks (scan progress, upscale queue,
+            # VLM status); an unencodable payload must not raise into them.
+            try:
+                message = self._encode(channel, event, data)
+            except Exception as e:
+                logger.error(f"Dropping unencodable {channel}/{event} broadcast: {e}")
+                return
+            asyncio.run_coroutine_threadsafe(self._send(message), self._loop)
             return
         try:
             loop = asyncio.get_running_loop()
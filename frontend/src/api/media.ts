@@ -1,5 +1,5 @@
 import type { Media } from '../types/media'
-import { get, patch, del } from './client'
+import { get, put, patch, del } from './client'
 
 export function fetchAllMedia(sort = 'date_added', favoritesOnly = false): Promise<Media[]> {
   const params = new URLSearchParams({ sort })
@@ -19,6 +19,13 @@ export function deleteMedia(filePath: string): Promise<{ status: string }> {
   return del<{ status: string }>(`/media/${encodeURIComponent(filePath)}`)
 }
 
+export function setFavorite(
+  filePath: string,
+  isFavorite: boolean,
+): Promise<{ file_path: string; is_favorite: boolean }> {
+  return put(`/favorites/${encodeURIComponent(filePath)}`, { is_favorite: isFavorite })
+}
+
 export function updateMedia(filePath: string, updates: Partial<Pick<Media, 'is_favorite' | 'playback_speed'>>): Promise<Media> {
   return patch<Media>(`/media/${encodeURIComponent(filePath)}`, updates)
 }
@@ -0,0 +1,23 @@
+import { ref } from 'vue'
+
+// Single-slot "copied" flash for MetadataField copy buttons. One field
+// flashes at a time and all fields share one timer, so a run of copies
+// doesn't leave a pending timeout (and its closure) per click.
+const flashingId = ref<number | null>(null)
+let flashTimer: ReturnType<typeof setTimeout> | null = null
+let nextId = 0
+
+export function useCopyFlash(duration = 1200) {
+  const id = ++nextId
+
+  function flash() {
+    flashingId.value = id
+    if (flashTimer) clearTimeout(flashTimer)
+    flashTimer = setTimeout(() => {
+      flashingId.value = null
+      flashTimer = null
+    }, duration)
+  }
+
+  return { flashingId, id, flash }
+}
@@ -11,7 +11,7 @@ import type {
   SmartFolder,
   SmartRules,
 } from '../types/folders'
-import { fileName } from '../utils/path'
+import { fileNameLower } from '../utils/path'
 import { fetchTagPaths } from '../api/filters'
 import * as foldersApi from '../api/folders'
 import type { FolderRecord } from '../api/folders'
@@ -119,78 +119,101 @@ function normalizeModel(m: Media): string {
   return ''
 }
 
-export function evaluateCondition(m: Media, c: SmartCondition): boolean {
+type MediaPredicate = (m: Media) => boolean
+
+const never: MediaPredicate = () => false
+
+// Compile a condition into a predicate once, so evaluating a smart folder
+// over the whole library does the per-rule work (lower-casing the needle,
+// normalising tag values, computing the date cutoff) a single time instead
+// of once per media item.
+export function compileCondition(c: SmartCondition): MediaPredicate {
   const { field, op, value } = c
   switch (field) {
     case 'favorite': {
       const v = Boolean(value)
-      return op === 'is' ? m.is_favorite === v : m.is_favorite !== v
+      return op === 'is' ? (m) => m.is_favorite === v : (m) => m.is_favorite !== v
     }
     case 'type': {
-      const kind = m.is_video ? 'video' : 'image'
-      return op === 'is' ? kind === value : kind !== value
+      const kind = (m: Media) => (m.is_video ? 'video' : 'image')
+      return op === 'is' ? (m) => kind(m) === value : (m) => kind(m) !== value
     }
     case 'model': {
-      const model = normalizeModel(m)
       const v = String(value ?? '')
-      if (op === 'is') return model === v
-      if (op === 'is_not') return model !== v
-      if (op === 'contains')
-        return model.toLowerCase().includes(v.toLowerCase())
-      return false
+      if (op === 'is') return (m) => normalizeModel(m) === v
+      if (op === 'is_not') return (m) => normalizeModel(m) !== v
+      if (op === 'contains') {
+        const needle = v.toLowerCase()
+        return (m) => normalizeModel(m).toLowerCase().includes(needle)
+      }
+      return never
     }
     case 'filename': {
-      const hay = (m.file_name ?? fileName(m.file_path)).toLowerCase()
       const needle = String(value ?? '').toLowerCase()
-      if (op === 'contains') return hay.includes(needle)
-      if (op === 'does_not_contain') return !hay.includes(needle)
-      if (op === 'starts_with') return hay.startsWith(needle)
-      return false
+      const hay = (m: Media) => fileNameLower(m.file_path)
+      if (op === 'contains') return (m) => hay(m).includes(needle)
+      if (op === 'does_not_contain') return (m) => !hay(m).includes(needle)
+      if (op === 'starts_with') return (m) => hay(m).startsWith(needle)
+      return never
     }
     case 'tags': {
       // Tag membership comes from the same inverted index the sidebar tag
       // filter uses. We can't rely on m.tags — it's only populated on
-      // detail-loaded records.
+      // detail-loaded records. The index is read at call time, so a
+      // compiled predicate sees reloads.
       const vals = Array.isArray(value)
         ? value
         : value === undefined || value === null || value === ''
           ? []
           : [String(value)]
-      if (vals.length === 0) return false
-      const path = m.file_path
-      const hasTag = (v: string): boolean => tagPathSets[v]?.has(path) ?? false
-      if (op === 'all_of') return vals.every(hasTag)
-      if (op === 'any_of') return vals.some(hasTag)
-      return false
+      if (vals.length === 0) return never
+      const hasTag = (v: string, path: string): boolean =>
+        tagPathSets[v]?.has(path) ?? false
+      if (op === 'all_of') return (m) => vals.every((v) => hasTag(v, m.file_path))
+      if (op === 'any_of') return (m) => vals.some((v) => hasTag(v, m.file_path))
+      return never
     }
     case 'modified':
     case 'added': {
       // 'modified' reads the file's mtime; 'added' reads the row's
       // created_at. Two historical value shapes: ISO timestamp string
       // (new rows) or stringified unix-epoch float (back-filled rows).
-      const raw = field === 'modified' ? m.modified_at : m.created_at
-      if (!raw) return false
-      let t: number
-      const asNum = Number(raw)
-      if (Number.isFinite(asNum)) {
-        t = asNum * 1000
-      } else {
-        t = Date.parse(raw)
-      }
-      if (Number.isNaN(t)) return false
+      if (op !== 'within_days' && op !== 'older_than_days') return never
       const days = Number(value) || 0
       const cutoff = Date.now() - days * 86400000
-      if (op === 'within_days') return t >= cutoff
-      if (op === 'older_than_days') return t < cutoff
-      return false
+      const within = op === 'within_days'
+      return (m) => {
+        const raw = field === 'modified' ? m.modified_at : m.created_at
+        if (!raw) return false
+        let t: number
+        const asNum = Number(raw)
+        if (Number.isFinite(asNum)) {
+          t = asNum * 1000
+        } else {
+          t = Date.parse(raw)
+        }
+        if (Number.isNaN(t)) return false
+        return within ? t >= cutoff : t < cutoff
+      }
     }
   }
+  return never
+}
+
+export function compileRules(rules: SmartRules): MediaPredicate {
+  if (!rules.conditions.length) return () => true
+  const preds = rules.conditions.map(compileCondition)
+  return rules.match === 'any'
+    ? (m) => preds.some((p) => p(m))
+    : (m) => preds.every((p) => p(m))
+}
+
+export function evaluateCondition(m: Media, c: SmartCondition): boolean {
+  return compileCondition(c)(m)
 }
 
 export function matches(m: Media, rules: SmartRules): boolean {
-  if (!rules.conditions.length) return true
-  const results = rules.conditions.map((c) => evaluateCondition(m, c))
-  return rules.match === 'any' ? results.some(Boolean) : results.every(Boolean)
+  return compileRules(rules)(m)
 }
 
 export const useFoldersStore = defineStore('folders', () => {
@@ -373,7 +396,7 @@ export const useFoldersStore = defineStore('folders', () => {
     if (s.kind === 'smart') {
       const f = smartFolders.value.find((x) => x.id === s.id)
       if (!f) return []
-      return all.filter((m) => matches(m, f.rules))
+      return all.filter(compileRules(f.rules))
     }
     return all
   }
@@ -396,8 +419,9 @@ export const useFoldersStore = defineStore('folders', () => {
     if (kind === 'smart') {
       const f = smartFolders.value.find((x) => x.id === id)
       if (!f) return 0
+      const match = compileRules(f.rules)
       let n = 0
-      for (const m of all) if (matches(m, f.rules)) n++
+      for (const m of all) if (match(m)) n++
       return n
     }
     return 0
@@ -2,7 +2,7 @@ import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
 import type { Media } from '../types/media'
 import type { ActiveFilters } from '../types/filters'
-import { fetchAllMedia, fetchMediaDetails, updateMedia, deleteMedia } from '../api/media'
+import { fetchAllMedia, fetchMediaDetails, setFavorite, deleteMedia } from '../api/media'
 import { applyFilters } from '../api/filters'
 import { useFoldersStore } from './folders'
 
@@ -44,17 +44,51 @@ export const useMediaStore = defineStore('media', () => {
     return folders.scopeMedia(displayedMedia.value)
   })
 
-  async function loadAllMedia() {
-    loading.value = true
-    try {
-      const data = await fetchAllMedia(sortOrder.value)
-      allMedia.value = data
-      favoritePaths.value = new Set(
-        data.filter((m) => m.is_favorite).map((m) => m.file_path),
-      )
-    } finally {
-      loading.value = false
+  // file_path → position in scopedMedia. Opening the viewer and grid
+  // keyboard navigation look items up by path; building the map once per
+  // list change beats a findIndex scan per lookup on large libraries.
+  const scopedIndex = computed(() => {
+    const index = new Map<string, number>()
+    scopedMedia.value.forEach((m, i) => index.set(m.file_path, i))
+    return index
+  })
+
+  // Each selection writes selectedMedia twice — the summary, then the
+  // detail record for the same path. Views that only care *which* item is
+  // selected (the grid highlight) read this instead: a computed string that
+  // doesn't change on the detail upgrade, so they re-render once per click.
+  const selectedPath = computed(() => selectedMedia.value?.file_path ?? null)
+
+  // Reloads arrive in bursts (watcher refresh, scan close, F5, a sort
+  // change). A call made while a fetch is in flight doesn't start another
+  // full-list request; it marks the current one to fetch once more when it
+  // finishes, so a burst costs at most two fetches and the list is never
+  // replaced by an older response.
+  let loadInFlight: Promise<void> | null = null
+  let reloadQueued = false
+
+  function loadAllMedia(): Promise<void> {
+    if (loadInFlight) {
+      reloadQueued = true
+      return loadInFlight
     }
+    loadInFlight = (async () => {
+      loading.value = true
+      try {
+        do {
+          reloadQueued = false
+          const data = await fetchAllMedia(sortOrder.value)
+          allMedia.value = data
+          favoritePaths.value = new Set(
+            data.filter((m) => m.is_favorite).map((m) => m.file_path),
+          )
+        } while (reloadQueued)
+      } finally {
+        loading.value = false
+        loadInFlight = null
+      }
+    })()
+    return loadInFlight
   }
 
   async function applyActiveFilters(filters: ActiveFilters) {
@@ -78,7 +112,14 @@ export const useMediaStore = defineStore('media', () => {
   // background updates.
   //
   // Returns the detail object so callers awaiting selection can use it.
+  //
+  // Arrow-key runs through the grid select at key-repeat rate. The summary
+  // still lands immediately, but while selections keep arriving less than
+  // DETAIL_SETTLE_MS apart the fetch is held back, so only the item the user
+  // stops on is fetched and rendered in full. A lone click fetches at once.
+  const DETAIL_SETTLE_MS = 60
   let selectionToken = 0
+  let lastSelectAt = 0
   async function selectMedia(summary: Media | null): Promise<Media | null> {
     if (summary === null) {
       selectedMedia.value = null
@@ -91,7 +132,14 @@ export const useMediaStore = defineStore('media', () => {
     // upgrade to the full record when it arrives.
     selectedMedia.value = summary
     detailLoading.value = true
+    const now = performance.now()
+    const inBurst = now - lastSelectAt < DETAIL_SETTLE_MS
+    lastSelectAt = now
     try {
+      if (inBurst) {
+        await new Promise((resolve) => setTimeout(resolve, DETAIL_SETTLE_MS))
+        if (token !== selectionToken) return null
+      }
       const detail = await fetchMediaDetails(summary.file_path)
       if (token === selectionToken) {
         selectedMedia.value = detail
@@ -107,16 +155,30 @@ export const useMediaStore = defineStore('media', () => {
     }
   }
 
+  // Write one favorite flag onto every local copy of a file: the list
+  // summary, the favorites set, and the selected detail record. Flipping the
+  // field in place rather than swapping objects re-renders only the star,
+  // and leaves the detail record's AI fields alone.
+  function applyFavorite(filePath: string, isFavorite: boolean) {
+    const idx = allMedia.value.findIndex((m) => m.file_path === filePath)
+    if (idx >= 0) allMedia.value[idx].is_favorite = isFavorite
+    if (isFavorite) favoritePaths.value.add(filePath)
+    else favoritePaths.value.delete(filePath)
+    if (selectedMedia.value?.file_path === filePath) {
+      selectedMedia.value.is_favorite = isFavorite
+    }
+  }
+
+  // Optimistic: the star flips in the same frame as the click or F key, and
+  // the write goes out behind it. A failed write rolls the flag back.
   async function toggleFavorite(media: Media) {
-    const updated = await updateMedia(media.file_path, { is_favorite: !media.is_favorite })
-    const idx = allMedia.value.findIndex((m) => m.file_path === media.file_path)
-    if (idx >= 0) allMedia.value[idx] = updated
-    // `updated` is a summary — it lacks prompt/tags/etc. Only mirror the
-    // flipped flag onto the current detail record so we don't blow away the
-    // AI fields we just loaded for the panel.
-    if (selectedMedia.value?.file_path === media.file_path) {
-      selectedMedia.value.is_favorite = updated.is_favorite
-      selectedMedia.value.playback_speed = updated.playback_speed
+    const previous = media.is_favorite
+    applyFavorite(media.file_path, !previous)
+    try {
+      await setFavorite(media.file_path, !previous)
+    } catch (e) {
+      applyFavorite(media.file_path, previous)
+      console.error('Failed to update favorite', e)
     }
   }
 
@@ -143,7 +205,9 @@ export const useMediaStore = defineStore('media', () => {
     allMedia,
     displayedMedia,
     scopedMedia,
+    scopedIndex,
     selectedMedia,
+    selectedPath,
     selectedPaths,
     sortOrder,
     favoritesOnly,
@@ -3,6 +3,10 @@
 // where the browser runs on the Windows host — `navigator.clipboard` is
 // `undefined` and writeText throws silently. Fall back to a hidden textarea +
 // `document.execCommand('copy')` so copy works regardless of origin.
+// Applied in one cssText write instead of five property assignments.
+const HIDDEN_TEXTAREA_CSS =
+  'position:fixed;top:0;left:0;opacity:0;pointer-events:none;'
+
 export async function copyToClipboard(text: string): Promise<boolean> {
   if (window.isSecureContext && navigator.clipboard?.writeText) {
     try {
@@ -16,11 +20,7 @@ export async function copyToClipboard(text: string): Promise<boolean> {
   const textarea = document.createElement('textarea')
   textarea.value = text
   textarea.setAttribute('readonly', '')
-  textarea.style.position = 'fixed'
-  textarea.style.top = '0'
-  textarea.style.left = '0'
-  textarea.style.opacity = '0'
-  textarea.style.pointerEvents = 'none'
+  textarea.style.cssText = HIDDEN_TEXTAREA_CSS
   document.body.appendChild(textarea)
   textarea.select()
   textarea.setSelectionRange(0, text.length)
@@ -0,0 +1,33 @@
+const SIZE_UNITS = ['B', 'KB', 'MB']
+
+// Human-readable file size for the viewer info bar and metadata panel.
+// The unit comes straight from the value's magnitude (each unit is 2^10
+// of the previous) instead of a chain of threshold comparisons; sizes of
+// a gigabyte and up stay in MB, as before.
+export function formatSize(bytes: number): string {
+  if (bytes < 1024) return `${bytes} B`
+  const exp = Math.min(SIZE_UNITS.length - 1, Math.floor(Math.log2(bytes) / 10))
+  return `${(bytes / 2 ** (10 * exp)).toFixed(1)} ${SIZE_UNITS[exp]}`
+}
+
+// Date#toLocaleString() resolves locale data and builds a formatter on
+// every call; one shared instance with the same fields gives identical
+// output for the price of a single construction. Shared by every panel
+// section that shows a timestamp.
+const DATE_TIME_FORMAT = new Intl.DateTimeFormat(undefined, {
+  year: 'numeric',
+  month: 'numeric',
+  day: 'numeric',
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric',
+})
+
+// Unparseable input (e.g. odd EXIF dates, back-filled epoch strings) is
+// returned as-is: Intl's format() throws RangeError on an invalid Date,
+// which would otherwise abort the panel's computed mid-render.
+export function formatDateTime(isoStr: string): string {
+  const date = new Date(isoStr)
+  if (isNaN(date.getTime())) return isoStr
+  return DATE_TIME_FORMAT.format(date)
+}
@@ -1,7 +1,35 @@
 // Extract the final path component ("basename") from a file path. Used by
 // components that receive lightweight Media summaries — the list endpoint
 // no longer ships `file_name` to keep the payload small.
+//
+// Grid cards re-derive the name every time a row scrolls back into view,
+// so results are memoized per path. The memo is dropped wholesale once it
+// reaches NAME_CACHE_LIMIT; a rebuild is just one pass of cheap lookups.
+const NAME_CACHE_LIMIT = 50_000
+const nameCache = new Map<string, string>()
+
 export function fileName(filePath: string): string {
-  const match = filePath.match(/[^/\\]+$/)
-  return match ? match[0] : filePath
+  let name = nameCache.get(filePath)
+  if (name === undefined) {
+    const match = filePath.match(/[^/\\]+$/)
+    name = match ? match[0] : filePath
+    if (nameCache.size >= NAME_CACHE_LIMIT) nameCache.clear()
+    nameCache.set(filePath, name)
+  }
+  return name
+}
+
+// Lower-cased basename, for case-insensitive filename matching. Smart
+// folders evaluate filename rules against every item in the library on
+// each scope change, so the folded name is memoized alongside.
+const lowerNameCache = new Map<string, string>()
+
+export function fileNameLower(filePath: string): string {
+  let name = lowerNameCache.get(filePath)
+  if (name === undefined) {
+    name = fileName(filePath).toLowerCase()
+    if (lowerNameCache.size >= NAME_CACHE_LIMIT) lowerNameCache.clear()
+    lowerNameCache.set(filePath, name)
+  }
+  return name
 }
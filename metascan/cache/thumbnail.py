@@ -1,13 +1,16 @@
+from collections import OrderedDict
 from pathlib import Path
 from PIL import Image, ImageOps
 from typing import Optional, Tuple, List, Dict, Set
 import hashlib
+import io
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import subprocess
 import shutil
 import os
 import sys
+import threading
 
 try:
     import ffmpeg
@@ -17,11 +20,17 @@ except ImportError:
     HAS_FFMPEG_PYTHON = False
 
 from metascan.utils.heic import register_heif_opener
+from metascan.core.media import VIDEO_EXTENSIONS
 
 register_heif_opener()
 
 logger = logging.getLogger(__name__)
 
+# Encoded video placeholder JPEGs keyed by thumbnail size. Every video that
+# fails frame extraction gets the identical image, so it's drawn and
+# encoded once per size and later failures only write the bytes out.
+_VIDEO_PLACEHOLDER_CACHE: Dict[Tuple[int, int], bytes] = {}
+
 
 def _find_ffmpeg() -> Optional[str]:
     """Find ffmpeg executable on the system."""
@@ -79,6 +88,11 @@ class ThumbnailCache:
     """Manages thumbnail generation and caching"""
 
     DEFAULT_SIZE = (256, 256)
+    RESOLVED_CACHE_SIZE = 4096
+    # Cold thumbnails decode on a pool of this size. Decodes are CPU-bound
+    # (and ffmpeg-bound for video), so more threads than cores only thrash;
+    # the cap keeps a cold grid from also saturating a spinning disk.
+    DECODE_WORKERS = max(1, min(6, os.cpu_count() or 1))
     SUPPORTED_FORMATS = {
         ".png",
         ".jpg",
@@ -97,47 +111,132 @@ class ThumbnailCache:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.thumbnail_size = thumbnail_size
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.DECODE_WORKERS, thread_name_prefix="thumbnail-decode"
+        )
+        # Recently served thumbnails keyed by source path, each tagged with
+        # the source's (mtime, size) it was resolved for. A hit costs one
+        # stat of the source plus an existence check, instead of an extra
+        # exists(), re-hashing the cache key and statting both files.
+        self._resolved: "OrderedDict[Path, Tuple[float, int, Path]]" = OrderedDict()
+        # One lock per thumbnail being generated. The API resolves thumbnails
+        # on worker threads, and the grid and viewer often ask for the same
+        # item at once; later callers wait for the first decode and reuse its
+        # file instead of decoding (and writing the same JPEG) again.
+        self._inflight: Dict[Path, threading.Lock] = {}
+        self._lock = threading.Lock()
 
     def get_thumbnail_path(self, media_path: Path) -> Optional[Path]:
         """Get the cache path for a thumbnail"""
-        # Check if media file exists first
-        if not media_path.exists():
+        try:
+            stat = media_path.stat()
+        except FileNotFoundError:
             logger.warning(f"Media file not found: {media_path}")
             return None
+        return self._thumbnail_path_for(media_path, stat)
 
+    def _thumbnail_path_for(self, media_path: Path, stat: os.stat_result) -> Path:
         # Create a unique filename based on original path and modification time
-        stat = media_path.stat()
         unique_string = f"{media_path}_{stat.st_mtime}_{stat.st_size}"
         hash_name = hashlib.md5(unique_string.encode()).hexdigest()
-
         return self.cache_dir / f"{hash_name}.jpg"
 
+    def _lookup(self, media_path: Path, stat: os.stat_result) -> Optional[Path]:
+        cached = self._resolved.get(media_path)
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime
+            and cached[1] == stat.st_size
+            and cached[2].exists()
+        ):
+            return cached[2]
+        return None
+
+    def _remember(self, media_path: Path, stat: os.stat_result, result: Path) -> None:
+        # Caller holds self._lock.
+        self._resolved[media_path] = (stat.st_mtime, stat.st_size, result)
+        self._resolved.move_to_end(media_path)
+        if len(self._resolved) > self.RESOLVED_CACHE_SIZE:
+            self._resolved.popitem(last=False)
+
+    def get_cached_thumbnail(self, media_path: Path) -> Optional[Path]:
+        """Return an existing, up-to-date thumbnail without creating one.
+
+        None means the thumbnail still has to be generated (or the source is
+        missing/unsupported); see ``submit_thumbnail``.
+        """
+        if not self._is_supported_format(media_path):
+            return None
+        try:
+            stat = media_path.stat()
+        except FileNotFoundError:
+            return None
+        hit = self._lookup(media_path, stat)
+        if hit is not None:
+            return hit
+        thumbnail_path = self._thumbnail_path_for(media_path, stat)
+        try:
+            if thumbnail_path.stat().st_mtime < stat.st_mtime:
+                return None
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            # Writers save straight to the final path, so a file that is
+            # still being generated may be partial. Checked after the stat:
+            # the writer registers before it writes and unregisters only
+            # once the file is complete.
+            if thumbnail_path in self._inflight:
+                return None
+            self._remember(media_path, stat, thumbnail_path)
+        return thumbnail_path
+
+    def submit_thumbnail(self, media_path: Path) -> "Future[Optional[Path]]":
+        """Resolve a thumbnail on the bounded decode pool."""
+        return self._executor.submit(self.get_or_create_thumbnail, media_path)
+
     def get_or_create_thumbnail(self, media_path: Path) -> Optional[Path]:
         """Get thumbnail from cache or create if it doesn't exist"""
         if not self._is_supported_format(media_path):
             logger.warning(f"Unsupported media format: {media_path}")
             return None
 
-        thumbnail_path = self.get_thumbnail_path(media_path)
-        if thumbnail_path is None:
-            # Media file doesn't exist
+        try:
+            stat = media_path.stat()
+        except FileNotFoundError:
+            logger.warning(f"Media file not found: {media_path}")
             return None
 
-        # Check if thumbnail exists and is newer than source
-        if thumbnail_path.exists():
-            if thumbnail_path.stat().st_mtime >= media_path.stat().st_mtime:
-                return thumbnail_path
+        hit = self._lookup(media_path, stat)
+        if hit is not None:
+            return hit
+
+        thumbnail_path = self._thumbnail_path_for(media_path, stat)
 
-        # Create thumbnail
-        return self._create_thumbnail(media_path, thumbnail_path)
+        with self._lock:
+            inflight = self._inflight.setdefault(thumbnail_path, threading.Lock())
+        with inflight:
+            # Check if thumbnail exists and is newer than source
+            if (
+                thumbnail_path.exists()
+                and thumbnail_path.stat().st_mtime >= stat.st_mtime
+            ):
+                result: Optional[Path] = thumbnail_path
+            else:
+                result = self._create_thumbnail(media_path, thumbnail_path)
+
+        with self._lock:
+            if self._inflight.get(thumbnail_path) is inflight:
+                del self._inflight[thumbnail_path]
+            if result is not None:
+                self._remember(media_path, stat, result)
+        return result
 
     def _create_thumbnail(
         self, media_path: Path, thumbnail_path: Path
     ) -> Optional[Path]:
         """Create a thumbnail for the given media file"""
         try:
-            if media_path.suffix.lower() in {".mp4", ".webm", ".mov"}:
+            if media_path.suffix.lower() in VIDEO_EXTENSIONS:
                 return self._create_video_thumbnail(media_path, thumbnail_path)
             else:
                 return self._create_image_thumbnail(media_path, thumbnail_path)
@@ -151,14 +250,20 @@ class ThumbnailCache:
         """Create a thumbnail for an image file"""
         try:
             with Image.open(image_path) as img:
+                # Let JPEGs decode straight at a reduced DCT scale (1/2..1/8)
+                # that still covers the thumbnail. thumbnail() would do this
+                # itself, but exif_transpose() below forces a full-size load
+                # first. The box is square so rotated sources stay covered.
+                edge = max(self.thumbnail_size)
+                img.draft(None, (edge, edge))
                 img = ImageOps.exif_transpose(img)
-                # Convert RGBA to RGB if necessary
+                # Flatten alpha onto white before resampling: an RGB resize
+                # skips Pillow's premultiply/unpremultiply round-trip, and
+                # getchannel() copies only the alpha band where split()
+                # would copy every band at full resolution.
                 if img.mode in ("RGBA", "LA"):
                     background = Image.new("RGB", img.size, (255, 255, 255))
-                    if img.mode == "RGBA":
-                        background.paste(img, mask=img.split()[3])
-                    else:
-                        background.paste(img, mask=img.split()[1])
+                    background.paste(img, mask=img.getchannel("A"))
                     img = background
                 elif img.mode not in ("RGB", "L"):
                     img = img.convert("RGB")
@@ -319,30 +424,12 @@ class ThumbnailCache:
     def _create_video_placeholder(self, thumbnail_path: Path) -> Optional[Path]:
         """Create a placeholder thumbnail for videos when extraction fails"""
         try:
-            # Create a simple placeholder image
-            img = Image.new("RGB", self.thumbnail_size, (64, 64, 64))
-
-            # Add a play button symbol
-            from PIL import ImageDraw
-
-            draw = ImageDraw.Draw(img)
-
-            # Calculate play button size
-            center_x, center_y = (
-                self.thumbnail_size[0] // 2,
-                self.thumbnail_size[1] // 2,
-            )
-            button_size = min(self.thumbnail_size) // 4
-
-            # Draw play triangle
-            points = [
-                (center_x - button_size // 2, center_y - button_size // 2),
-                (center_x - button_size // 2, center_y + button_size // 2),
-                (center_x + button_size // 2, center_y),
-            ]
-            draw.polygon(points, fill=(255, 255, 255))
-
-            img.save(thumbnail_path, "JPEG", quality=85)
+            size = (self.thumbnail_size[0], self.thumbnail_size[1])
+            data = _VIDEO_PLACEHOLDER_CACHE.get(size)
+            if data is None:
+                data = self._render_video_placeholder()
+                _VIDEO_PLACEHOLDER_CACHE[size] = data
+            thumbnail_path.write_bytes(data)
             logger.debug("Created video placeholder thumbnail")
             return thumbnail_path
 
@@ -350,6 +437,34 @@ class ThumbnailCache:
             logger.error(f"Failed to create video placeholder: {e}")
             return None
 
+    def _render_video_placeholder(self) -> bytes:
+        # Create a simple placeholder image
+        img = Image.new("RGB", self.thumbnail_size, (64, 64, 64))
+
+        # Add a play button symbol
+        from PIL import ImageDraw
+
+        draw = ImageDraw.Draw(img)
+
+        # Calculate play button size
+        center_x, center_y = (
+            self.thumbnail_size[0] // 2,
+            self.thumbnail_size[1] // 2,
+        )
+        button_size = min(self.thumbnail_size) // 4
+
+        # Draw play triangle
+        points = [
+            (center_x - button_size // 2, center_y - button_size // 2),
+            (center_x - button_size // 2, center_y + button_size // 2),
+            (center_x + button_size // 2, center_y),
+        ]
+        draw.polygon(points, fill=(255, 255, 255))
+
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=85)
+        return buf.getvalue()
+
     def create_thumbnails_batch(
         self, media_paths: List[Path], callback=None
     ) -> Dict[Path, Optional[Path]]:
@@ -381,6 +496,7 @@ class ThumbnailCache:
 
     def clear_cache(self):
         """Clear all cached thumbnails"""
+        self._resolved.clear()
         count = 0
         for thumbnail in self.cache_dir.glob("*.jpg"):
             try:
@@ -406,6 +522,7 @@ class ThumbnailCache:
                 return True
 
             # Move cache directory to trash using platform-specific method
+            self._resolved.clear()
             self._move_cache_to_trash_platform()
 
             # Recreate cache directory
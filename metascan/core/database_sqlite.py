@@ -8,7 +8,7 @@ from threading import Lock
 
 from metascan.utils.startup_profiler import log_startup
 from metascan.utils.path_utils import to_posix_path, to_native_path
-from metascan.core.media import Media
+from metascan.core.media import Media, VIDEO_EXTENSIONS
 from metascan.core.prompt_tokenizer import PromptTokenizer
 
 logger = logging.getLogger(__name__)
@@ -897,7 +897,6 @@ class DatabaseManager:
             f"FROM media {where} ORDER BY {order_clause}"
         )
         out: List[Dict[str, Any]] = []
-        video_exts = {".mp4", ".webm", ".mov"}
         try:
             with self._get_connection() as conn:
                 rows = conn.execute(sql).fetchall()
@@ -909,7 +908,7 @@ class DatabaseManager:
                         {
                             "file_path": file_path,
                             "is_favorite": bool(row["is_favorite"]),
-                            "is_video": ext in video_exts,
+                            "is_video": ext in VIDEO_EXTENSIONS,
                             "playback_speed": (
                                 float(playback) if playback is not None else None
                             ),
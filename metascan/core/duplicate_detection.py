@@ -7,9 +7,9 @@ import logging
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Set, Tuple
 
-logger = logging.getLogger(__name__)
+from metascan.core.media import VIDEO_EXTENSIONS
 
-VIDEO_EXTENSIONS = {".mp4", ".webm", ".mov"}
+logger = logging.getLogger(__name__)
 
 
 def _is_video_path(file_path: str) -> bool:
@@ -6,16 +6,21 @@ from dataclasses_json import dataclass_json, config
 
 from metascan.utils.path_utils import to_posix_path, to_native_path
 
+# Suffixes (lower-case, with dot) treated as video everywhere in the app:
+# Media.is_video, the scanner, thumbnailer, extractors and pHash. Defined
+# once so those checks can't drift apart when a format is added.
+VIDEO_EXTENSIONS = frozenset({".mp4", ".webm", ".mov"})
+
 
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class LoRA:
     lora_name: str
     lora_weight: float
 
 
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class PhotoExposure:
     """Exposure / lens settings — serialized to media.photo_exposure JSON column.
 
@@ -33,7 +38,7 @@ class PhotoExposure:
 
 
 @dataclass_json
-@dataclass
+@dataclass(slots=True)
 class Media:
     file_path: Path = field(
         metadata=config(
@@ -100,7 +105,7 @@ class Media:
 
     @property
     def is_video(self) -> bool:
-        return self.file_extension in {".mp4", ".webm", ".mov"}
+        return self.file_extension in VIDEO_EXTENSIONS
 
     @property
     def is_image(self) -> bool:
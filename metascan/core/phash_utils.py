@@ -10,6 +10,8 @@ from typing import Optional
 
 from PIL import Image
 
+from metascan.core.media import VIDEO_EXTENSIONS
+
 logger = logging.getLogger(__name__)
 
 _imagehash = None
@@ -32,7 +34,7 @@ def compute_phash_for_file(file_path: Path) -> Optional[str]:
     Returns the hex string representation, or None on error.
     """
     ext = file_path.suffix.lower()
-    if ext in {".mp4", ".webm", ".mov"}:
+    if ext in VIDEO_EXTENSIONS:
         return _compute_video_phash(file_path)
     else:
         return _compute_image_phash(file_path)
@@ -1,5 +1,6 @@
+import os
 from pathlib import Path
-from typing import List, Optional, Callable, Tuple, Any
+from typing import AbstractSet, List, Optional, Callable, Tuple, Any
 from queue import Queue
 from threading import Thread
 import logging
@@ -9,7 +10,12 @@ import threading
 import queue
 import time
 from metascan.utils.startup_profiler import log_startup
-from metascan.core.media import Media, LoRA, PhotoExposure as MediaPhotoExposure
+from metascan.core.media import (
+    VIDEO_EXTENSIONS,
+    LoRA,
+    Media,
+    PhotoExposure as MediaPhotoExposure,
+)
 from metascan.core.database_sqlite import DatabaseManager
 from metascan.extractors import MetadataExtractorManager
 from metascan.core.phash_utils import compute_phash_for_file
@@ -48,6 +54,36 @@ def _photo_exposure_to_media(src: PhotoExifExposure) -> "MediaPhotoExposure":
     )
 
 
+def _find_media_files(
+    directory: Path, recursive: bool, extensions: AbstractSet[str]
+) -> List[Path]:
+    """List files under ``directory`` whose extension is in ``extensions``.
+
+    Matches the lower- and upper-case spelling of each extension, like the
+    per-extension ``glob("*.png")`` / ``glob("*.PNG")`` pairs this replaces,
+    but walks the tree once instead of twice per extension and only builds
+    a ``Path`` for names that match.
+    """
+    accepted = set(extensions) | {ext.upper() for ext in extensions}
+
+    def matches(name: str) -> bool:
+        dot = name.rfind(".")
+        return dot >= 0 and name[dot:] in accepted
+
+    media_files: List[Path] = []
+    if recursive:
+        for root, _dirs, files in os.walk(directory, followlinks=True):
+            media_files.extend(Path(root, name) for name in files if matches(name))
+    else:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if matches(entry.name) and not entry.is_dir():
+                    media_files.append(Path(entry.path))
+
+    media_files.sort()
+    return media_files
+
+
 class Scanner:
     SUPPORTED_EXTENSIONS = {
         ".png",
@@ -148,21 +184,7 @@ class Scanner:
         return processed_count
 
     def _find_media_files(self, directory: Path, recursive: bool) -> List[Path]:
-        media_files: List[Path] = []
-
-        if recursive:
-            for ext in self.SUPPORTED_EXTENSIONS:
-                media_files.extend(directory.rglob(f"*{ext}"))
-                media_files.extend(directory.rglob(f"*{ext.upper()}"))
-        else:
-            for ext in self.SUPPORTED_EXTENSIONS:
-                media_files.extend(directory.glob(f"*{ext}"))
-                media_files.extend(directory.glob(f"*{ext.upper()}"))
-
-        media_files = list(set(media_files))
-        media_files.sort()
-
-        return media_files
+        return _find_media_files(directory, recursive, self.SUPPORTED_EXTENSIONS)
 
     def _read_image_info_and_exif(self, file_path: Path) -> Tuple[
         Tuple[Optional[int], Optional[int], Optional[str]],
@@ -173,7 +195,7 @@ class Scanner:
         photo_exif, orientation_tag). Pixel decode is skipped unless EXIF
         orientation requires it — keeps the AI-gen PNG hot path fast.
         """
-        if file_path.suffix.lower() in {".mp4", ".webm", ".mov"}:
+        if file_path.suffix.lower() in VIDEO_EXTENSIONS:
             return (None, None, None), None, None
         try:
             with Image.open(file_path) as img:
@@ -201,7 +223,7 @@ class Scanner:
 
             # Single image open: dimensions, format, photo EXIF, and
             # orientation all come back from one read.
-            if file_path.suffix.lower() in {".mp4", ".webm", ".mov"}:
+            if file_path.suffix.lower() in VIDEO_EXTENSIONS:
                 width, height, format_name = self._get_video_info(file_path)
                 photo_exif, orientation_tag = None, None
             else:
@@ -303,7 +325,7 @@ class Scanner:
         self, file_path: Path
     ) -> Tuple[Optional[int], Optional[int], Optional[str]]:
         """Video-only path. For images use ``_read_image_info_and_exif``."""
-        if file_path.suffix.lower() in {".mp4", ".webm", ".mov"}:
+        if file_path.suffix.lower() in VIDEO_EXTENSIONS:
             return self._get_video_info(file_path)
         # Fallback for callers that expect the legacy 3-tuple. Image callers
         # in this module should prefer _read_image_info_and_exif which avoids
@@ -521,21 +543,7 @@ class ThreadedScanner:
         self.stop_event.set()
 
     def _find_media_files(self, directory: Path, recursive: bool) -> List[Path]:
-        media_files: List[Path] = []
-        supported_extensions = Scanner.SUPPORTED_EXTENSIONS
-
-        if recursive:
-            for ext in supported_extensions:
-                media_files.extend(directory.rglob(f"*{ext}"))
-                media_files.extend(directory.rglob(f"*{ext.upper()}"))
-        else:
-            for ext in supported_extensions:
-                media_files.extend(directory.glob(f"*{ext}"))
-                media_files.extend(directory.glob(f"*{ext.upper()}"))
-
-        media_files = list(set(media_files))
-        media_files.sort()
-        return media_files
+        return _find_media_files(directory, recursive, Scanner.SUPPORTED_EXTENSIONS)
 
     def _start_threads(self, media_files: List[Path]) -> None:
         self.producer_thread = threading.Thread(
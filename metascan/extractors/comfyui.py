@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 import logging
 
+from metascan.core.media import VIDEO_EXTENSIONS
 from metascan.extractors.base import MetadataExtractor
 
 logger = logging.getLogger(__name__)
@@ -13,7 +14,7 @@ class ComfyUIExtractor(MetadataExtractor):
 
     def can_extract(self, media_path: Path) -> bool:
         """Check if image contains ComfyUI metadata"""
-        if media_path.suffix.lower() in {".mp4", ".webm", ".mov"}:
+        if media_path.suffix.lower() in VIDEO_EXTENSIONS:
             return False
 
         metadata = self._get_exif_metadata(media_path)
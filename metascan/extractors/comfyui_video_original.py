@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
+from metascan.core.media import VIDEO_EXTENSIONS
 from metascan.extractors.base import MetadataExtractor
 
 logger = logging.getLogger(__name__)
@@ -13,7 +14,7 @@ class ComfyUIVideoExtractor(MetadataExtractor):
     """Extract metadata from ComfyUI generated MP4 videos"""
 
     def can_extract(self, media_path: Path) -> bool:
-        if media_path.suffix.lower() not in {".mp4", ".webm", ".mov"}:
+        if media_path.suffix.lower() not in VIDEO_EXTENSIONS:
             return False
 
         metadata = self._get_video_metadata(media_path)
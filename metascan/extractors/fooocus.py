@@ -4,6 +4,7 @@ from typing import Dict, Any, Optional, List
 import logging
 import re
 
+from metascan.core.media import VIDEO_EXTENSIONS
 from metascan.extractors.base import MetadataExtractor
 
 logger = logging.getLogger(__name__)
@@ -12,7 +13,7 @@ logger = logging.getLogger(__name__)
 class FooocusExtractor(MetadataExtractor):
     def can_extract(self, media_path: Path) -> bool:  # noqa: C901
         """Check if image contains Fooocus metadata"""
-        if media_path.suffix.lower() in {".mp4", ".webm", ".mov"}:
+        if media_path.suffix.lower() in VIDEO_EXTENSIONS:
             return False
 
         metadata = self._get_exif_metadata(media_path)
@@ -3,6 +3,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 import logging
 
+from metascan.core.media import VIDEO_EXTENSIONS
 from metascan.extractors.base import MetadataExtractor
 
 logger = logging.getLogger(__name__)
@@ -10,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 class SwarmUIExtractor(MetadataExtractor):
     def can_extract(self, media_path: Path) -> bool:
-        if media_path.suffix.lower() in {".mp4", ".webm", ".mov"}:
+        if media_path.suffix.lower() in VIDEO_EXTENSIONS:
             return False
 
         metadata = self._get_exif_metadata(media_path)
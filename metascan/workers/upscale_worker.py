@@ -203,7 +203,12 @@ class UpscaleWorker:
                 raise ValueError(f"Task {self.task_id} not found in queue")
 
             task_data = queue_data["tasks"][self.task_id]
-            self.logger.debug(f"Loaded task data: {json.dumps(task_data, indent=2)}")
+            # The f-string is built before logging checks the level, so only
+            # pay for the indented dump when debug output is on.
+            if self.debug:
+                self.logger.debug(
+                    f"Loaded task data: {json.dumps(task_data, indent=2)}"
+                )
             return task_data
 
         except TimeoutError:
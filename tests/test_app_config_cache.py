@@ -0,0 +1,75 @@
+"""Tests for the mtime-keyed config.json cache in backend.config."""
+
+import json
+import os
+
+import pytest
+
+from backend import config as app_config
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    monkeypatch.setattr(app_config, "get_config_path", lambda: path)
+    monkeypatch.setattr(app_config, "_config_cache", {"key": None, "value": {}})
+    return path
+
+
+def test_missing_file_returns_empty(config_file):
+    assert app_config.load_app_config() == {}
+
+
+def test_unchanged_file_is_parsed_once(config_file, monkeypatch):
+    config_file.write_text(json.dumps({"theme": "dark"}))
+    calls = []
+    real_load = json.load
+
+    def counting_load(fp):
+        calls.append(fp)
+        return real_load(fp)
+
+    monkeypatch.setattr(app_config.json, "load", counting_load)
+    assert app_config.load_app_config() == {"theme": "dark"}
+    assert app_config.load_app_config() == {"theme": "dark"}
+    assert len(calls) == 1
+
+
+def test_external_edit_is_picked_up(config_file):
+    config_file.write_text(json.dumps({"theme": "dark"}))
+    assert app_config.load_app_config()["theme"] == "dark"
+
+    config_file.write_text(json.dumps({"theme": "light"}))
+    st = config_file.stat()
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert app_config.load_app_config()["theme"] == "light"
+
+
+def test_returned_dict_is_a_copy(config_file):
+    config_file.write_text(json.dumps({"directories": []}))
+    first = app_config.load_app_config()
+    first["directories"].append({"filepath": "/tmp"})
+    assert app_config.load_app_config() == {"directories": []}
+
+
+def test_save_invalidates_cache(config_file):
+    app_config.save_app_config({"theme": "dark"})
+    assert app_config.load_app_config() == {"theme": "dark"}
+    app_config.save_app_config({"theme": "light"})
+    assert app_config.load_app_config() == {"theme": "light"}
+
+
+def test_config_endpoints_round_trip(config_file):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from backend.api import config as config_api
+
+    app = FastAPI()
+    app.include_router(config_api.router)
+    with TestClient(app) as client:
+        assert client.get("/api/config").json() == {}
+        resp = client.put("/api/config", json={"theme": "dark"})
+        assert resp.json() == {"theme": "dark"}
+        assert client.get("/api/config").json() == {"theme": "dark"}
+    assert json.loads(config_file.read_text()) == {"theme": "dark"}
@@ -0,0 +1,133 @@
+"""REST tests for /api/media."""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from PIL import Image
+
+from metascan.cache.thumbnail import ThumbnailCache
+from metascan.core.database_sqlite import DatabaseManager
+from metascan.core.media import Media
+
+
+def _seed_media(db: DatabaseManager, paths) -> None:
+    for p in paths:
+        db.save_media(
+            Media(
+                file_path=Path(p),
+                file_size=1,
+                width=1,
+                height=1,
+                format="png",
+                created_at=datetime.now(),
+                modified_at=datetime.now(),
+            )
+        )
+
+
+class TestMediaApi(unittest.TestCase):
+    tmp: Optional[tempfile.TemporaryDirectory] = None
+
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("METASCAN_API_KEY", "")
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+        self.db = DatabaseManager(self.data_dir)
+        _seed_media(self.db, ["/lib/a.png", "/lib/b.mp4"])
+
+        import backend.dependencies as deps
+
+        deps._db_singleton = self.db  # type: ignore[attr-defined]
+        deps._thumbnail_cache_singleton = ThumbnailCache(  # type: ignore[attr-defined]
+            self.data_dir / "thumbnails"
+        )
+
+        from backend.api import media as media_api
+
+        app = FastAPI()
+        app.include_router(media_api.router)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.client.close()
+        import backend.dependencies as deps
+
+        deps._db_singleton = None  # type: ignore[attr-defined]
+        deps._thumbnail_cache_singleton = None  # type: ignore[attr-defined]
+        assert self.tmp is not None
+        self.tmp.cleanup()
+
+    def test_list_returns_summaries(self):
+        resp = self.client.get("/api/media")
+        self.assertEqual(resp.status_code, 200, resp.text)
+        self.assertEqual(resp.headers["content-type"], "application/json")
+        by_path = {m["file_path"]: m for m in resp.json()}
+        self.assertEqual(set(by_path), {"/lib/a.png", "/lib/b.mp4"})
+        self.assertFalse(by_path["/lib/a.png"]["is_video"])
+        self.assertTrue(by_path["/lib/b.mp4"]["is_video"])
+        self.assertNotIn("prompt", by_path["/lib/a.png"])
+
+    def test_list_favorites_only(self):
+        self.db.set_favorite(Path("/lib/a.png"), True)
+        resp = self.client.get("/api/media", params={"favorites_only": True})
+        self.assertEqual(resp.status_code, 200, resp.text)
+        self.assertEqual([m["file_path"] for m in resp.json()], ["/lib/a.png"])
+
+    def test_detail_returns_full_record(self):
+        resp = self.client.get("/api/media//lib/a.png")
+        self.assertEqual(resp.status_code, 200, resp.text)
+        self.assertEqual(resp.headers["content-type"], "application/json")
+        body = resp.json()
+        self.assertEqual(body["file_path"], "/lib/a.png")
+        self.assertEqual(body["file_name"], "a.png")
+        self.assertEqual(body["media_type"], "image")
+        self.assertEqual(body["tags"], [])
+        self.assertIsInstance(body["created_at"], str)
+
+    def test_detail_missing_is_404(self):
+        resp = self.client.get("/api/media//lib/nope.png")
+        self.assertEqual(resp.status_code, 404)
+
+    def test_set_favorite_round_trip(self):
+        resp = self.client.put("/api/favorites//lib/a.png", json={"is_favorite": True})
+        self.assertEqual(resp.status_code, 200, resp.text)
+        self.assertEqual(resp.json(), {"file_path": "/lib/a.png", "is_favorite": True})
+        self.assertEqual(self.db.get_favorite_media_paths(), {"/lib/a.png"})
+
+        resp = self.client.put("/api/favorites//lib/a.png", json={"is_favorite": False})
+        self.assertEqual(resp.status_code, 200, resp.text)
+        self.assertEqual(self.db.get_favorite_media_paths(), set())
+
+    def test_set_favorite_missing_is_404(self):
+        resp = self.client.put(
+            "/api/favorites//lib/nope.png", json={"is_favorite": True}
+        )
+        self.assertEqual(resp.status_code, 404)
+
+    def test_thumbnail_revalidation_returns_304(self):
+        src = self.data_dir / "c.png"
+        Image.new("RGB", (64, 64), (255, 0, 0)).save(src)
+
+        url = f"/api/thumbnails/{src}"
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200, first.text)
+        etag = first.headers["etag"]
+
+        again = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b"")
+        self.assertEqual(again.headers["etag"], etag)
+
+        stale = self.client.get(url, headers={"If-None-Match": '"stale"'})
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(stale.content, first.content)
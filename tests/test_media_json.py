@@ -10,7 +10,7 @@ must fall back to a tolerant parser instead of dropping the whole row.
 
 import json
 
-from metascan.core.media import Media
+from metascan.core.media import VIDEO_EXTENSIONS, Media
 
 
 _BASE = {
@@ -57,3 +57,11 @@ def test_from_json_fast_strict_payload_unchanged():
     m = Media.from_json_fast(payload)
 
     assert m.generation_data == {"k": 1}
+
+
+def test_is_video_uses_shared_extension_set():
+    assert isinstance(VIDEO_EXTENSIONS, frozenset)
+    for name, expected in (("a.MP4", True), ("b.webm", True), ("c.png", False)):
+        media = Media.from_json_fast(json.dumps({**_BASE, "file_path": f"/tmp/{name}"}))
+        assert media.is_video is expected
+        assert media.media_type == ("video" if expected else "image")
@@ -0,0 +1,56 @@
+"""Tests for media file discovery and counting ahead of a scan."""
+
+from metascan.core.scanner import Scanner, _find_media_files
+
+
+def _touch(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    return path
+
+
+def test_recursive_walk_matches_supported_extensions(tmp_path):
+    a = _touch(tmp_path / "a.png")
+    b = _touch(tmp_path / "sub" / "deeper" / "b.MP4")
+    _touch(tmp_path / "notes.txt")
+    _touch(tmp_path / "sub" / "noext")
+
+    found = _find_media_files(tmp_path, True, Scanner.SUPPORTED_EXTENSIONS)
+
+    assert found == sorted([a, b])
+
+
+def test_non_recursive_stays_in_directory(tmp_path):
+    a = _touch(tmp_path / "a.jpg")
+    _touch(tmp_path / "sub" / "b.jpg")
+    (tmp_path / "dir.png").mkdir()
+
+    found = _find_media_files(tmp_path, False, Scanner.SUPPORTED_EXTENSIONS)
+
+    assert found == [a]
+
+
+def test_mixed_case_extension_is_not_matched(tmp_path):
+    # Same contract as the glob("*.png") / glob("*.PNG") pairs it replaced.
+    _touch(tmp_path / "a.Png")
+    assert _find_media_files(tmp_path, True, {".png"}) == []
+
+
+def test_prepare_counts_per_directory(tmp_path):
+    from backend.api.scan import _count_media_files
+    from backend.config import DirectoryConfig
+
+    _touch(tmp_path / "a.PNG")
+    _touch(tmp_path / "sub" / "b.mov")
+    _touch(tmp_path / "sub" / "c.txt")
+
+    total, stats = _count_media_files(
+        [
+            DirectoryConfig(str(tmp_path), search_subfolders=True),
+            DirectoryConfig(str(tmp_path), search_subfolders=False),
+            DirectoryConfig(str(tmp_path / "missing")),
+        ]
+    )
+
+    assert [s["file_count"] for s in stats] == [2, 1]
+    assert total == 3
@@ -0,0 +1,186 @@
+"""Tests for ThumbnailCache lookup and generation."""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from metascan.cache.thumbnail import ThumbnailCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ThumbnailCache(tmp_path / "thumbs", thumbnail_size=(64, 64))
+
+
+def _make_image(path: Path, size=(400, 300), mode="RGB") -> Path:
+    Image.new(mode, size).save(path)
+    return path
+
+
+def test_creates_thumbnail_within_bounds(cache, tmp_path):
+    src = _make_image(tmp_path / "a.png")
+    thumb = cache.get_or_create_thumbnail(src)
+    assert thumb is not None and thumb.exists()
+    with Image.open(thumb) as img:
+        assert max(img.size) <= 64
+
+
+def test_missing_source_returns_none(cache, tmp_path):
+    assert cache.get_or_create_thumbnail(tmp_path / "missing.png") is None
+
+
+def test_repeat_lookup_is_served_from_memo(cache, tmp_path, monkeypatch):
+    src = _make_image(tmp_path / "a.png")
+    first = cache.get_or_create_thumbnail(src)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("thumbnail should not be recomputed")
+
+    monkeypatch.setattr(cache, "_thumbnail_path_for", fail)
+    assert cache.get_or_create_thumbnail(src) == first
+
+
+def test_concurrent_requests_decode_once(cache, tmp_path, monkeypatch):
+    src = _make_image(tmp_path / "a.png")
+    calls = []
+    calls_lock = threading.Lock()
+    create = cache._create_thumbnail
+
+    def slow_create(media_path, thumbnail_path):
+        with calls_lock:
+            calls.append(media_path)
+        time.sleep(0.05)
+        return create(media_path, thumbnail_path)
+
+    monkeypatch.setattr(cache, "_create_thumbnail", slow_create)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: cache.get_or_create_thumbnail(src), range(4)))
+
+    assert len(calls) == 1
+    assert len(set(results)) == 1 and results[0] is not None
+    assert cache._inflight == {}
+
+
+def test_cached_lookup_never_creates(cache, tmp_path):
+    src = _make_image(tmp_path / "a.png")
+    assert cache.get_cached_thumbnail(src) is None
+    assert not any(cache.cache_dir.iterdir())
+
+    thumb = cache.submit_thumbnail(src).result()
+    assert thumb is not None
+    assert cache.get_cached_thumbnail(src) == thumb
+
+
+def test_cached_lookup_skips_thumbnail_being_written(cache, tmp_path, monkeypatch):
+    src = _make_image(tmp_path / "a.png")
+    writing = threading.Event()
+    release = threading.Event()
+    create = cache._create_thumbnail
+
+    def slow_create(media_path, thumbnail_path):
+        thumbnail_path.write_bytes(b"\xff\xd8partial")
+        writing.set()
+        release.wait(5)
+        return create(media_path, thumbnail_path)
+
+    monkeypatch.setattr(cache, "_create_thumbnail", slow_create)
+    future = cache.submit_thumbnail(src)
+    assert writing.wait(5)
+    try:
+        assert cache.get_cached_thumbnail(src) is None
+    finally:
+        release.set()
+    thumb = future.result()
+    assert thumb is not None
+    assert cache.get_cached_thumbnail(src) == thumb
+
+
+def test_submitted_decodes_are_bounded(cache, tmp_path, monkeypatch):
+    sources = [_make_image(tmp_path / f"{i}.png", size=(8, 8)) for i in range(12)]
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+    create = cache._create_thumbnail
+
+    def tracked_create(media_path, thumbnail_path):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        try:
+            return create(media_path, thumbnail_path)
+        finally:
+            with lock:
+                running -= 1
+
+    monkeypatch.setattr(cache, "_create_thumbnail", tracked_create)
+    futures = [cache.submit_thumbnail(src) for src in sources]
+    assert all(f.result() is not None for f in futures)
+    assert 1 <= peak <= ThumbnailCache.DECODE_WORKERS
+
+
+def test_modified_source_gets_new_thumbnail(cache, tmp_path):
+    src = _make_image(tmp_path / "a.png")
+    first = cache.get_or_create_thumbnail(src)
+    _make_image(src, size=(200, 100))
+    st = src.stat()
+    os.utime(src, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = cache.get_or_create_thumbnail(src)
+    assert second is not None and second != first
+
+
+def test_clear_cache_drops_memo(cache, tmp_path):
+    src = _make_image(tmp_path / "a.png")
+    cache.get_or_create_thumbnail(src)
+    assert cache.clear_cache() == 1
+    thumb = cache.get_or_create_thumbnail(src)
+    assert thumb is not None and thumb.exists()
+
+
+def test_alpha_source_is_flattened(cache, tmp_path):
+    src = _make_image(tmp_path / "a.png", mode="RGBA")
+    thumb = cache.get_or_create_thumbnail(src)
+    assert thumb is not None
+    with Image.open(thumb) as img:
+        assert img.mode == "RGB"
+
+
+def test_rotated_jpeg_keeps_orientation(cache, tmp_path):
+    src = tmp_path / "rotated.jpg"
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: rotate 90° CW on display
+    Image.new("RGB", (800, 400)).save(src, exif=exif)
+    thumb = cache.get_or_create_thumbnail(src)
+    assert thumb is not None
+    with Image.open(thumb) as img:
+        assert img.size == (32, 64)
+
+
+def test_video_suffix_routes_to_video_thumbnailer(cache, tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        cache, "_create_video_thumbnail", lambda src, dst: calls.append(src) or dst
+    )
+    src = tmp_path / "clip.MOV"
+    cache._create_thumbnail(src, tmp_path / "clip.jpg")
+    assert calls == [src]
+
+
+def test_video_placeholder_is_rendered_once(cache, tmp_path, monkeypatch):
+    first = cache._create_video_placeholder(tmp_path / "a.jpg")
+    assert first is not None
+    with Image.open(first) as img:
+        assert img.size == (64, 64)
+
+    def fail():
+        raise AssertionError("placeholder should come from the cache")
+
+    monkeypatch.setattr(cache, "_render_video_placeholder", fail)
+    second = cache._create_video_placeholder(tmp_path / "b.jpg")
+    assert second is not None and second.read_bytes() == first.read_bytes()
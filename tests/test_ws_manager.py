@@ -0,0 +1,82 @@
+"""Tests for the WebSocket ConnectionManager."""
+
+import asyncio
+import json
+import threading
+
+from backend.ws.manager import ConnectionManager
+
+
+class _FakeSocket:
+    def __init__(self) -> None:
+        self.sent = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(text)
+
+
+class _BrokenSocket:
+    async def send_text(self, text: str) -> None:
+        raise RuntimeError("closed")
+
+
+def test_broadcast_sends_envelope_and_drops_dead_sockets():
+    manager = ConnectionManager()
+    good, bad = _FakeSocket(), _BrokenSocket()
+    manager.active_connections = [good, bad]
+
+    asyncio.run(manager.broadcast("scan", "progress", {"current": 1}))
+
+    assert [json.loads(m) for m in good.sent] == [
+        {"channel": "scan", "event": "progress", "data": {"current": 1}}
+    ]
+    assert manager.active_connections == [good]
+
+
+def test_broadcast_sync_from_worker_thread():
+    manager = ConnectionManager()
+    sock = _FakeSocket()
+    manager.active_connections = [sock]
+
+    async def run() -> None:
+        manager.attach_loop(asyncio.get_running_loop())
+        worker = threading.Thread(
+            target=manager.broadcast_sync, args=("embedding", "complete", {"total": 3})
+        )
+        worker.start()
+        await asyncio.to_thread(worker.join)
+        for _ in range(50):
+            if sock.sent:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+
+    assert [json.loads(m) for m in sock.sent] == [
+        {"channel": "embedding", "event": "complete", "data": {"total": 3}}
+    ]
+
+
+def test_broadcast_sync_drops_unencodable_payload():
+    manager = ConnectionManager()
+    sock = _FakeSocket()
+    manager.active_connections = [sock]
+
+    async def run() -> None:
+        manager.attach_loop(asyncio.get_running_loop())
+        # Lone surrogates and non-str keys are rejected by orjson.
+        await asyncio.to_thread(
+            manager.broadcast_sync, "scan", "progress", {"file": "bad\udcff"}
+        )
+        await asyncio.to_thread(manager.broadcast_sync, "scan", "progress", {1: 2})
+        await asyncio.to_thread(manager.broadcast_sync, "scan", "progress", {"ok": 1})
+        for _ in range(50):
+            if sock.sent:
+                break
+            await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+
+    assert [json.loads(m) for m in sock.sent] == [
+        {"channel": "scan", "event": "progress", "data": {"ok": 1}}
+    ]